@@ -142,10 +142,23 @@ def cli():
     help='\n'.join(CHECK_OPTIONS),
 )
 @click.option('--json', 'json_output', is_flag=True, help='Format output as json')
-def lint(repo_path, checks, json_output):
+@click.option(
+    '--streaming',
+    is_flag=True,
+    help='Parse and lint view files in batches to bound memory usage',
+)
+def lint(repo_path, checks, json_output, streaming):
     checks = _parse_checks(checks)
-    lkml = lookmlint.lookml_from_repo_path(repo_path)
     lint_config = lookmlint.read_lint_config(repo_path)
+    if streaming:
+        lkml = lookmlint.StreamingLookML(
+            repo_path,
+            view_checks=[c for c in checks if c in lookmlint.VIEW_CHECKS],
+            acronyms=lint_config['acronyms'],
+            abbreviations=lint_config['abbreviations'],
+        )
+    else:
+        lkml = lookmlint.lookml_from_repo_path(repo_path)
     lint_results = {
         check_name: _run_check(check_name, lkml, lint_config) for check_name in checks
     }
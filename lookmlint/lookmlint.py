@@ -1,8 +1,11 @@
 from collections import Counter
+import glob
 import json
 import os
 import re
+import shlex
 import subprocess
+import tempfile
 
 import attr
 import yaml
@@ -135,6 +138,7 @@ class Model(object):
 class View(object):
 
     data = attr.ib(repr=False)
+    file_name = attr.ib(default=None, repr=False)
     name = attr.ib(init=False)
     label = attr.ib(init=False)
     dimensions = attr.ib(init=False, repr=False)
@@ -170,9 +174,19 @@ class View(object):
     def has_primary_key(self):
         return any(d.is_primary_key for d in self.dimensions)
 
+    def summary(self):
+        return ViewSummary(name=self.name, label=self.label, extends=self.extends)
+
     def has_sql_definition(self):
         return self.sql_table_name is not None or self.derived_table_sql is not None
 
+    def is_missing_sql_definition(self):
+        return (
+            not self.has_sql_definition()
+            and self.extends == []
+            and any(f.sql and '${TABLE}' in f.sql for f in self.fields)
+        )
+
     def derived_table_contains_semicolon(self):
         return self.derived_table_sql is not None and ';' in self.derived_table_sql
 
@@ -180,6 +194,14 @@ class View(object):
         return self.derived_table_sql is not None and len(re.findall('(?:[^/])(\*)(?:[^/])', self.derived_table_sql)) > 0 and '#noqa:select-star' not in self.derived_table_sql
 
 
+@attr.s
+class ViewSummary(object):
+
+    name = attr.ib()
+    label = attr.ib()
+    extends = attr.ib(repr=False)
+
+
 @attr.s
 class Dimension(object):
 
@@ -251,8 +273,35 @@ class Measure(object):
         return len(self.drill_fields) > 0 or self.type in ["number", "percent_of_previous", "percent_of_total"] or self.is_hidden or '#noqa:drill-fields' in self.tags
 
 
+class _Project(object):
+
+    def _match_source_views(self):
+        # match explore views with their source views
+        for m in self.models:
+            for e in m.explores:
+                for ev in e.views:
+                    source_view = next(
+                        v for v in self.views if v.name == ev.source_view_name()
+                    )
+                    ev.source_view = source_view
+
+    def all_explore_views(self):
+        explore_views = []
+        for m in self.models:
+            explore_views += m.explore_views()
+        return explore_views
+
+    def unused_view_files(self):
+        view_names = [v.name for v in self.views]
+        explore_view_names = [v.source_view.name for v in self.all_explore_views()]
+        extended_views = [exv for v in self.views for exv in v.extends]
+        return sorted(
+            list(set(view_names) - set(explore_view_names) - set(extended_views))
+        )
+
+
 @attr.s
-class LookML(object):
+class LookML(_Project):
 
     lookml_json_filepath = attr.ib()
     data = attr.ib(init=False, repr=False)
@@ -264,16 +313,8 @@ class LookML(object):
             self.data = json.load(f)
         model_dicts = [self._model(mn) for mn in self._model_file_names()]
         self.models = [Model(m) for m in model_dicts]
-        view_dicts = [self._view(vn) for vn in self._view_file_names()]
-        self.views = [View(v) for v in view_dicts]
-        # match explore views with their source views
-        for m in self.models:
-            for e in m.explores:
-                for ev in e.views:
-                    source_view = next(
-                        v for v in self.views if v.name == ev.source_view_name()
-                    )
-                    ev.source_view = source_view
+        self.views = [View(self._view(vn), file_name=vn) for vn in self._view_file_names()]
+        self._match_source_views()
 
     def _view_file_names(self):
         return sorted(self.data['file']['view'].keys())
@@ -287,27 +328,61 @@ class LookML(object):
     def _model(self, model_file_name):
         return self.data['file']['model'][model_file_name]['model'][model_file_name]
 
-    def mismatched_view_names(self):
-        results = {}
-        for vf in self._view_file_names():
-            v = View(self._view(vf))
-            if v.name != vf:
-                results[vf] = v.name
-        return results
+    def lint_views(self, checks, acronyms=[], abbreviations=[]):
+        return lint_views(self.views, checks, acronyms, abbreviations)
 
-    def all_explore_views(self):
-        explore_views = []
-        for m in self.models:
-            explore_views += m.explore_views()
-        return explore_views
 
-    def unused_view_files(self):
-        view_names = [v.name for v in self.views]
-        explore_view_names = [v.source_view.name for v in self.all_explore_views()]
-        extended_views = [exv for v in self.views for exv in v.extends]
-        return sorted(
-            list(set(view_names) - set(explore_view_names) - set(extended_views))
+@attr.s
+class StreamingLookML(_Project):
+    """Parses view files in batches, keeping only a `ViewSummary` of each view.
+
+    File-local `view_checks` run on each view while it is parsed, so `views`
+    only holds summaries and those checks cannot be rerun afterwards.
+    """
+
+    repo_path = attr.ib()
+    view_checks = attr.ib(default=attr.Factory(list))
+    acronyms = attr.ib(default=attr.Factory(list))
+    abbreviations = attr.ib(default=attr.Factory(list))
+    batch_size = attr.ib(default=200)
+    models = attr.ib(init=False, repr=False)
+    views = attr.ib(init=False, repr=False)
+    view_results = attr.ib(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self.full_path = os.path.expanduser(self.repo_path)
+        model_files = parse_files(self._file_paths('model')).get('model', {})
+        self.models = [
+            Model(model_files[mn]['model'][mn]) for mn in sorted(model_files.keys())
+        ]
+        self.views = []
+        self.view_results = lint_views(
+            self._parsed_views(), self.view_checks, self.acronyms, self.abbreviations
         )
+        self._match_source_views()
+
+    def _file_paths(self, file_type):
+        suffix = f'.{file_type}.lkml'
+        paths = glob.glob(os.path.join(glob.escape(self.full_path), f'*{suffix}'))
+        # sort by file name without suffix, matching LookML's ordering
+        return sorted(paths, key=lambda p: os.path.basename(p)[: -len(suffix)])
+
+    def _parsed_views(self):
+        paths = self._file_paths('view')
+        for i in range(0, len(paths), self.batch_size):
+            view_files = parse_files(paths[i : i + self.batch_size]).get('view', {})
+            for vf in sorted(view_files.keys()):
+                v = View(list(view_files[vf]['view'].values())[0], file_name=vf)
+                self.views.append(v.summary())
+                yield v
+
+    def lint_views(self, checks, acronyms=[], abbreviations=[]):
+        not_streamed = sorted(set(checks) - set(self.view_checks))
+        if not_streamed != []:
+            raise Exception(f'Checks: {not_streamed} were not run while streaming view files')
+        if 'label-issues' in checks and (acronyms, abbreviations) != (self.acronyms, self.abbreviations):
+            raise Exception('Lint config differs from the one used while streaming view files')
+        return {c: self.view_results[c] for c in checks}
 
 
 def read_lint_config(repo_path):
@@ -325,15 +400,33 @@ def read_lint_config(repo_path):
     return lint_config
 
 
-def parse_repo(full_path):
+def parse_repo(full_path, input_pattern='*.lkml', output_path='/tmp/lookmlint.json'):
     cmd = (
-        f'cd {full_path} && '
-        'lookml-parser --input="*.lkml" --whitespace=2 > /tmp/lookmlint.json'
+        f'cd {shlex.quote(full_path)} && '
+        f'lookml-parser --input={shlex.quote(input_pattern)} --whitespace=2 '
+        f'> {shlex.quote(output_path)}'
     )
     process = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE)
     output, error = process.communicate()
 
 
+def parse_files(paths):
+    # link the files into a scratch directory so that lookml-parser sees exactly
+    # these files, whatever characters their names contain
+    if paths == []:
+        return {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for path in paths:
+            os.symlink(os.path.abspath(path), os.path.join(tmp_dir, os.path.basename(path)))
+        output_path = os.path.join(tmp_dir, 'lookmlint.json')
+        parse_repo(tmp_dir, '*.lkml', output_path)
+        try:
+            with open(output_path) as f:
+                return json.load(f).get('file', {})
+        except (OSError, ValueError):
+            raise Exception(f'lookml-parser failed to parse: {paths}')
+
+
 def lookml_from_repo_path(repo_path):
     full_path = os.path.expanduser(repo_path)
     parse_repo(full_path)
@@ -377,11 +470,9 @@ def lint_labels(lkml, acronyms, abbreviations):
                 if m.name not in explore_view_label_issues:
                     explore_view_label_issues[m.name] = {}
                 explore_view_label_issues[m.name][e.name] = issues
-    field_label_issues = {}
-    for v in lkml.views:
-        issues = v.field_label_issues(acronyms, abbreviations)
-        if issues != {}:
-            field_label_issues[v.name] = issues
+    field_label_issues = lkml.lint_views(['label-issues'], acronyms, abbreviations)[
+        'label-issues'
+    ]
 
     # create overall labels issues dict
     label_issues = {}
@@ -426,17 +517,12 @@ def lint_sql_references(lkml):
 
 def lint_view_primary_keys(lkml):
     # check for missing primary keys
-    views_missing_primary_keys = [v.name for v in lkml.views if not v.has_primary_key()]
-    return views_missing_primary_keys
+    return lkml.lint_views(['views-missing-primary-keys'])['views-missing-primary-keys']
 
 
 def lint_missing_drill_fields(lkml):
     # check for measures missing drill fields
-    measures_missing_drill_fields = []
-    for v in lkml.views:
-        measures_missing_drill_fields += [(v.name, m.name) for m in v.measures if not m.has_drill_fields()]
-
-    return sorted(list(set(measures_missing_drill_fields)))
+    return lkml.lint_views(['missing-drill-fields'])['missing-drill-fields']
 
 
 def lint_unused_includes(lkml):
@@ -454,22 +540,56 @@ def lint_unused_view_files(lkml):
 
 
 def lint_missing_view_sql_definitions(lkml):
-    return [
-        v.name
-        for v in lkml.views
-        if not v.has_sql_definition()
-        and v.extends == []
-        and any(f.sql and '${TABLE}' in f.sql for f in v.fields)
-    ]
+    return lkml.lint_views(['missing-view-sql-definitions'])['missing-view-sql-definitions']
 
 
 def lint_semicolons_in_derived_table_sql(lkml):
-    return [v.name for v in lkml.views if v.derived_table_contains_semicolon()]
+    return lkml.lint_views(['semicolons-in-derived-table-sql'])['semicolons-in-derived-table-sql']
 
 
 def lint_select_star_in_derived_table_sql(lkml):
-    return [v.name for v in lkml.views if v.derived_table_contains_select_star()]
+    return lkml.lint_views(['select-star-in-derived-table-sql'])['select-star-in-derived-table-sql']
 
 
 def lint_mismatched_view_names(lkml):
-    return lkml.mismatched_view_names()
+    return lkml.lint_views(['mismatched-view-names'])['mismatched-view-names']
+
+
+def _view_checks(acronyms, abbreviations):
+    # file-local checks: each maps a single view to a partial result of the
+    # given type, and partial results are merged across views
+    def _field_label_issues(v):
+        issues = v.field_label_issues(acronyms, abbreviations)
+        return {v.name: issues} if issues != {} else {}
+
+    return {
+        'label-issues': (dict, _field_label_issues),
+        'views-missing-primary-keys': (list, lambda v: [v.name] if not v.has_primary_key() else []),
+        'missing-drill-fields': (list, lambda v: [(v.name, m.name) for m in v.measures if not m.has_drill_fields()]),
+        'missing-view-sql-definitions': (list, lambda v: [v.name] if v.is_missing_sql_definition() else []),
+        'semicolons-in-derived-table-sql': (list, lambda v: [v.name] if v.derived_table_contains_semicolon() else []),
+        'select-star-in-derived-table-sql': (list, lambda v: [v.name] if v.derived_table_contains_select_star() else []),
+        'mismatched-view-names': (dict, lambda v: {v.file_name: v.name} if v.name != v.file_name else {}),
+    }
+
+
+VIEW_CHECKS = sorted(_view_checks([], []).keys())
+
+
+def lint_views(views, checks, acronyms=[], abbreviations=[]):
+    # run file-local checks in a single pass over views, which may be a generator
+    view_checks = _view_checks(acronyms, abbreviations)
+    for check_name in checks:
+        if check_name not in view_checks:
+            raise Exception(f'Check: {check_name} is not a view check')
+    results = {c: view_checks[c][0]() for c in checks}
+    for v in views:
+        for check_name in checks:
+            result_type, check = view_checks[check_name]
+            if result_type is dict:
+                results[check_name].update(check(v))
+            else:
+                results[check_name] += check(v)
+    if 'missing-drill-fields' in results:
+        results['missing-drill-fields'] = sorted(list(set(results['missing-drill-fields'])))
+    return results
@@ -0,0 +1,157 @@
+import fnmatch
+import json
+import os
+
+from click.testing import CliRunner
+import pytest
+
+from lookmlint import cli, lookmlint
+
+
+# lookml-parser output for each file in the fixture project, keyed by file name
+PARSED_FILES = {
+    'test.model.lkml': {
+        'model': {
+            'test': {
+                '_model': 'test',
+                'include': ['orders.view', 'items.view', 'inventory_locations.view', 'web_sessions.view'],
+                'explore': {
+                    'orders': {
+                        '_explore': 'orders',
+                        '_model': 'test',
+                        'joins': [
+                            {'_join': 'order_items', '_explore': 'orders', 'sql_on': 'orders.id = order_items.order_id'},
+                        ],
+                    },
+                    'inventory_transfers': {
+                        '_explore': 'inventory_transfers',
+                        '_model': 'test',
+                        'label': 'Inventory Sku Transfers',
+                        'joins': [
+                            {'_join': 'origin', 'from': 'inventory_locations', '_explore': 'inventory_transfers'},
+                            {'_join': 'destination', 'from': 'inventory_locations', '_explore': 'inventory_transfers'},
+                        ],
+                    },
+                },
+            }
+        }
+    },
+    'orders.view.lkml': {
+        '_view': 'orders',
+        'sql_table_name': 'orders',
+        'dimension': {'id': {'_dimension': 'id', 'primary_key': True, 'sql': '${TABLE}.id'}},
+        'measure': {'count': {'_measure': 'count', 'type': 'count'}},
+    },
+    'items.view.lkml': {
+        '_view': 'order_items',
+        'dimension': {
+            'qty': {'_dimension': 'qty', 'sql': '${TABLE}.qty'},
+            'unit_cost_usd': {'_dimension': 'unit_cost_usd', 'sql': '${TABLE}.cost'},
+        },
+        'measure': {'total': {'_measure': 'total', 'type': 'sum', 'drill_fields': ['qty']}},
+    },
+    'inventory_transfers.view.lkml': {
+        '_view': 'inventory_transfers',
+        'derived_table': {'sql': 'select * from transfers;'},
+        'dimension': {'id': {'_dimension': 'id', 'primary_key': True}},
+    },
+    'inventory_locations.view.lkml': {
+        '_view': 'inventory_locations',
+        'label': 'Inventory Locations',
+        'sql_table_name': 'locations',
+        'dimension': {'id': {'_dimension': 'id', 'primary_key': True}},
+    },
+    'inventory-locations.view.lkml': {
+        '_view': 'legacy_locations',
+        'extends': ['inventory_locations'],
+        'measure': {'count': {'_measure': 'count', 'type': 'count'}},
+    },
+    'web_sessions.view.lkml': {
+        '_view': 'web_sessions',
+        'sql_table_name': 'sessions',
+        'dimension': {'num_pages': {'_dimension': 'num_pages', 'sql': '${TABLE}.pages'}},
+    },
+    'weird [1].view.lkml': {
+        '_view': 'weird_view',
+        'derived_table': {'sql': 'select id from t'},
+        'dimension': {'id': {'_dimension': 'id', 'primary_key': True}},
+    },
+}
+
+LINT_CONFIG = {'acronyms': ['usd', 'sku'], 'abbreviations': ['qty', 'num']}
+
+
+def _fake_parse_repo(full_path, input_pattern='*.lkml', output_path='/tmp/lookmlint.json'):
+    files = {}
+    for file_name in sorted(os.listdir(full_path)):
+        if file_name not in PARSED_FILES or not fnmatch.fnmatch(file_name, input_pattern):
+            continue
+        name, file_type, _ = file_name.rsplit('.', 2)
+        parsed = PARSED_FILES[file_name]
+        if file_type == 'view':
+            parsed = {'view': {parsed['_view']: parsed}}
+        files.setdefault(file_type, {})[name] = parsed
+    with open(output_path, 'w') as f:
+        json.dump({'file': files}, f)
+
+
+@pytest.fixture
+def repo_path(tmpdir, monkeypatch):
+    monkeypatch.setattr(lookmlint, 'parse_repo', _fake_parse_repo)
+    monkeypatch.setattr(lookmlint.tempfile, 'tempdir', str(tmpdir.mkdir('scratch')))
+    repo = tmpdir.mkdir('repo')
+    for file_name in PARSED_FILES:
+        repo.join(file_name).write('')
+    monkeypatch.setattr(lookmlint, 'lookml_from_repo_path', _lookml_from_repo_path(str(tmpdir)))
+    monkeypatch.setattr(lookmlint, 'read_lint_config', lambda repo_path: LINT_CONFIG)
+    return str(repo)
+
+
+def _lookml_from_repo_path(tmp_path):
+    # keep the default mode's parser output out of the shared /tmp path
+    def lookml_from_repo_path(repo_path):
+        output_path = os.path.join(tmp_path, 'lookmlint.json')
+        _fake_parse_repo(os.path.expanduser(repo_path), output_path=output_path)
+        return lookmlint.LookML(output_path)
+
+    return lookml_from_repo_path
+
+
+def _lint_json(repo_path, *args):
+    result = CliRunner().invoke(cli.lint, [repo_path, '--json'] + list(args))
+    assert result.exit_code == 0, result.output
+    return json.loads(result.output)
+
+
+def test_streaming_matches_default_mode(repo_path):
+    default_results = _lint_json(repo_path)
+    streaming_results = _lint_json(repo_path, '--streaming')
+    assert sorted(default_results.keys()) == sorted(set(cli.CHECK_OPTIONS) - set(['all']))
+    assert all(results not in ([], {}) for results in default_results.values())
+    assert streaming_results == default_results
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 3, 100])
+def test_streaming_batches_match_default_mode(repo_path, batch_size):
+    lkml = lookmlint.lookml_from_repo_path(repo_path)
+    streaming_lkml = lookmlint.StreamingLookML(
+        repo_path, view_checks=lookmlint.VIEW_CHECKS, batch_size=batch_size, **LINT_CONFIG
+    )
+    assert streaming_lkml.lint_views(lookmlint.VIEW_CHECKS, **LINT_CONFIG) == lkml.lint_views(
+        lookmlint.VIEW_CHECKS, **LINT_CONFIG
+    )
+    assert [v.name for v in streaming_lkml.views] == [v.name for v in lkml.views]
+    assert lookmlint.lint_unused_view_files(streaming_lkml) == lookmlint.lint_unused_view_files(lkml)
+
+
+def test_streaming_check_not_run_while_parsing(repo_path):
+    lkml = lookmlint.StreamingLookML(repo_path, view_checks=['views-missing-primary-keys'])
+    with pytest.raises(Exception, match='were not run while streaming'):
+        lookmlint.lint_semicolons_in_derived_table_sql(lkml)
+
+
+def test_parse_failure_reports_paths(repo_path, monkeypatch):
+    monkeypatch.setattr(lookmlint, 'parse_repo', lambda *args: None)
+    path = os.path.join(repo_path, 'orders.view.lkml')
+    with pytest.raises(Exception, match='orders.view.lkml'):
+        lookmlint.parse_files([path])